@@ -3,7 +3,7 @@ import sys
 import secrets
 import pathlib
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, FrozenSet
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
@@ -43,6 +43,17 @@ class SearchConfig(BaseModel):
     searxng: SearXNGConfig = SearXNGConfig()
     brave: BraveSearchConfig = BraveSearchConfig()
     duckduckgo: DuckDuckGoConfig = DuckDuckGoConfig()
+    cache_ttl: int = int(os.getenv("SEARCH_CACHE_TTL", "300"))
+    cache_max_size: int = int(os.getenv("SEARCH_CACHE_MAX_SIZE", "1000"))
+
+
+class ReadConfig(BaseModel):
+    cache_ttl: int = int(os.getenv("READ_CACHE_TTL", "600"))
+    cache_max_size: int = int(os.getenv("READ_CACHE_MAX_SIZE", "500"))
+    cache_max_mb: int = int(os.getenv("READ_CACHE_MAX_MB", "128"))
+    fetch_cache_ttl: int = int(os.getenv("READ_FETCH_CACHE_TTL", "300"))
+    fetch_cache_max_size: int = int(os.getenv("READ_FETCH_CACHE_MAX_SIZE", "100"))
+    fetch_cache_max_mb: int = int(os.getenv("READ_FETCH_CACHE_MAX_MB", "64"))
 
 
 def _generate_and_persist_api_key() -> str:
@@ -78,12 +89,18 @@ def _generate_and_persist_api_key() -> str:
 class SecurityConfig(BaseModel):
     api_keys: List[str] = [k.strip() for k in os.getenv("API_KEYS", "").split(",") if k.strip()]
     auth_enabled: bool = os.getenv("AUTH_ENABLED", "True").lower() == "true"
+    api_keys_set: FrozenSet[str] = frozenset()
 
     def __init__(self, **data):
         super().__init__(**data)
         if self.auth_enabled and not self.api_keys:
             key = _generate_and_persist_api_key()
             self.api_keys.append(key)
+            # Child processes (e.g. the parse workers) import this module again;
+            # exporting the key makes them reuse it instead of generating their own
+            os.environ["API_KEYS"] = key
+        # Hashed lookup for per-request key validation
+        self.api_keys_set = frozenset(self.api_keys)
 
 
 class Settings(BaseModel):
@@ -92,6 +109,7 @@ class Settings(BaseModel):
     port: int = int(os.getenv("PORT", "8000"))
     search: SearchConfig = SearchConfig()
     searxng: SearXNGConfig = SearXNGConfig()
+    read: ReadConfig = ReadConfig()
     security: SecurityConfig = SecurityConfig()
 
 
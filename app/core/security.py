@@ -25,7 +25,7 @@ async def get_api_key(request: Request, header_key: str = Security(api_key_heade
             detail="API key is missing. Pass via X-API-Key header or Authorization: Bearer <key>",
         )
 
-    if key not in settings.security.api_keys:
+    if key not in settings.security.api_keys_set:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -1,7 +1,25 @@
+import logging
 import aiohttp
 import json
 from typing import List, Dict, Any, Optional
+from yarl import URL
 from app.core.config import settings
+from app.utils.http import get_session
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_TIME_MAP = {
+    "day": "pd",  # past day
+    "week": "pw",  # past week
+    "month": "pm",  # past month
+    "year": "py"   # past year
+}
 
 
 class BraveSearchClient:
@@ -12,9 +30,18 @@ class BraveSearchClient:
         self.api_endpoint = "https://api.search.brave.com/res/v1/web/search"
         self.api_key = settings.search.brave.api_key
         self.timeout = settings.search.brave.timeout
+        self.default_max_results = settings.search.brave.max_results
+        self._timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        # Built once and reused for every request
+        self._base_url = URL(self.api_endpoint)
+        self._headers = {
+            "Accept": "application/json",
+            "X-Subscription-Token": self.api_key or ""
+        }
         
         if not self.api_key:
-            print("WARNING: Brave Search API key is not configured. API calls will fail.")
+            logger.warning("Brave Search API key is not configured. API calls will fail.")
     
     async def search(self, query: str, num_results: int = None, language: str = None, time_range: str = None) -> list:
         """
@@ -30,11 +57,11 @@ class BraveSearchClient:
             List of search results
         """
         if not self.api_key:
-            print("ERROR: Brave Search API key is not configured")
+            logger.error("Brave Search API key is not configured")
             return []
             
         if num_results is None:
-            num_results = settings.search.brave.max_results
+            num_results = self.default_max_results
         
         # Prepare search parameters
         params = {
@@ -50,43 +77,38 @@ class BraveSearchClient:
         if time_range:
             params["freshness"] = self._convert_time_range(time_range)
         
-        # Set up timeout
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            session = await get_session()
+            
+            # Make the request
+            async with session.get(
+                self._base_url.with_query(params), 
+                headers=self._headers,
+                timeout=self._timeout
+            ) as response:
+                if response.status != 200:
+                    # Only the start of the body is logged, so don't buffer the rest
+                    raw = await response.content.read(512)
+                    error_text = raw.decode("utf-8", "replace")
+                    logger.error("Brave Search API error: Status %s, Response: %s", response.status, error_text[:200])
+                    raise ValueError(f"Brave Search failed with status code: {response.status}")
+                
+                raw = await response.read()
                 try:
-                    # Make the request
-                    async with session.get(
-                        self.api_endpoint, 
-                        params=params, 
-                        headers={
-                            "Accept": "application/json",
-                            "X-Subscription-Token": self.api_key
-                        }
-                    ) as response:
-                        if response.status != 200:
-                            error_text = await response.text()
-                            print(f"Brave Search API error: Status {response.status}, Response: {error_text[:200]}")
-                            raise ValueError(f"Brave Search failed with status code: {response.status}")
-                        
-                        try:
-                            response_data = await response.json()
-                        except Exception as e:
-                            error_text = await response.text()
-                            print(f"Failed to parse Brave Search JSON response: {str(e)}")
-                            print(f"Response text: {error_text[:200]}")
-                            return []
-                        
-                        # Process and normalize results
-                        return self._process_brave_results(response_data)
-                        
-                except aiohttp.ClientError as e:
-                    print(f"Brave Search connection error: {str(e)}")
+                    response_data = orjson.loads(raw) if _ORJSON_AVAILABLE else json.loads(raw)
+                except ValueError as e:
+                    logger.error("Failed to parse Brave Search JSON response: %s", e)
+                    logger.debug("Response text: %s", raw[:200].decode("utf-8", "replace"))
                     return []
                 
+                # Process and normalize results
+                return self._process_brave_results(response_data)
+                
+        except aiohttp.ClientError as e:
+            logger.error("Brave Search connection error: %s", e)
+            return []
         except Exception as e:
-            print(f"Brave Search error: {str(e)}")
+            logger.error("Brave Search error: %s", e)
             return []
     
     def _process_brave_results(self, response_data: Dict[str, Any]) -> List[Dict[str, str]]:
@@ -135,10 +157,4 @@ class BraveSearchClient:
         Returns:
             Brave Search time range parameter
         """
-        time_map = {
-            "day": "pd",  # past day
-            "week": "pw",  # past week
-            "month": "pm",  # past month
-            "year": "py"   # past year
-        }
-        return time_map.get(time_range, "") 
\ No newline at end of file
+        return _TIME_MAP.get(time_range, "") 
\ No newline at end of file
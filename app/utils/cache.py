@@ -0,0 +1,110 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    In-memory LRU cache whose entries expire after a fixed time-to-live.
+
+    All operations are synchronous and never await, so they are atomic with
+    respect to other tasks on the event loop and need no lock.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: float = 300,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept; 0 disables caching
+            ttl: Seconds an entry stays valid; 0 disables caching
+            max_bytes: Optional budget for the total size of all values, as
+                measured by sizeof; values larger than the budget are not cached
+            sizeof: Returns the size of a value, required with max_bytes
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._bytes = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value, size = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._bytes -= size
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        if self.max_size <= 0 or self.ttl <= 0:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[2]
+
+        size = 0
+        if self.max_bytes is not None:
+            size = self._sizeof(value)
+            if size > self.max_bytes:
+                return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value, size)
+        self._bytes += size
+        while len(self._entries) > self.max_size or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight:
+    """Collapse concurrent calls that share a key into a single execution."""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await factory() for key, joining the in-flight call for that key if there is one.
+
+        Args:
+            key: Identifies calls that produce the same result
+            factory: Zero-argument callable returning the awaitable to run
+
+        Returns:
+            The result of the shared call
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one caller being cancelled does not cancel the others
+        return await asyncio.shield(future)
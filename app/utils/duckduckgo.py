@@ -1,18 +1,62 @@
+import logging
 import aiohttp
+import html
 import re
 import json
 from typing import List, Dict, Any
 from urllib.parse import unquote, urlencode
 from app.core.config import settings
+from app.utils.http import get_session
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    _SELECTOLAX_AVAILABLE = True
+except ImportError:
+    _SELECTOLAX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml",
+}
+
+# Map common language codes to DuckDuckGo region codes
+_LANGUAGE_MAP = {
+    "en-US": "us-en",
+    "en-GB": "uk-en",
+    "en-CA": "ca-en",
+    "fr-FR": "fr-fr",
+    "de-DE": "de-de",
+    "es-ES": "es-es",
+    "it-IT": "it-it",
+    "ja-JP": "jp-jp",
+}
+
+_TIME_MAP = {
+    "day": "d",
+    "week": "w",
+    "month": "m",
+    "year": "y"
+}
+
+# Patterns for the regex fallback parser
+_RESULT_PART_RE = re.compile(
+    r'<a rel="nofollow" class="result__a" href="([^"]+)">([^<]+)</a>'
+    r'|<a class="result__snippet" href="[^"]+">([^<]+(?:<[^>]+>[^<]+)*)</a>'
+)
+_TAG_RE = re.compile(r'<[^>]+>')
 
 
 class DuckDuckGoClient:
-    """Client for interacting with DuckDuckGo search engine without relying on additional libraries."""
+    """Client for interacting with DuckDuckGo search engine through its HTML endpoint."""
     
     def __init__(self):
         """Initialize DuckDuckGo client with configured settings."""
         self.search_url = "https://html.duckduckgo.com/html/"
         self.timeout = settings.search.duckduckgo.timeout
+        self.default_max_results = settings.search.duckduckgo.max_results
+        self._timeout = aiohttp.ClientTimeout(total=self.timeout)
     
     async def search(self, query: str, num_results: int = None, language: str = None, time_range: str = None) -> list:
         """
@@ -28,7 +72,7 @@ class DuckDuckGoClient:
             List of search results
         """
         if num_results is None:
-            num_results = settings.search.duckduckgo.max_results
+            num_results = self.default_max_results
         
         # Prepare search parameters
         params = {
@@ -40,84 +84,105 @@ class DuckDuckGoClient:
         if time_range:
             params["df"] = self._convert_time_range(time_range)
         
-        # Set up timeout
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                try:
-                    # Make the request
-                    async with session.post(
-                        self.search_url, 
-                        data=params,
-                        headers={
-                            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                            "Accept": "text/html,application/xhtml+xml,application/xml",
-                        }
-                    ) as response:
-                        if response.status != 200:
-                            error_text = await response.text()
-                            print(f"DuckDuckGo error: Status {response.status}, Response: {error_text[:200]}")
-                            raise ValueError(f"DuckDuckGo search failed with status code: {response.status}")
-                        
-                        html_content = await response.text()
-                        
-                        # Parse the HTML response
-                        results = self._parse_html_results(html_content)
-                        return results[:num_results]
-                        
-                except aiohttp.ClientError as e:
-                    print(f"DuckDuckGo connection error: {str(e)}")
-                    return []
+            session = await get_session()
+            
+            # Make the request
+            async with session.post(
+                self.search_url, 
+                data=params,
+                headers=_HEADERS,
+                timeout=self._timeout
+            ) as response:
+                if response.status != 200:
+                    # Only the start of the body is logged, so don't buffer the rest
+                    raw = await response.content.read(512)
+                    error_text = raw.decode("utf-8", "replace")
+                    logger.error("DuckDuckGo error: Status %s, Response: %s", response.status, error_text[:200])
+                    raise ValueError(f"DuckDuckGo search failed with status code: {response.status}")
+                
+                html_content = await response.text()
                 
+                # Parse the HTML response
+                results = self._parse_html_results(html_content)
+                return results[:num_results]
+                
+        except aiohttp.ClientError as e:
+            logger.error("DuckDuckGo connection error: %s", e)
+            return []
         except Exception as e:
-            print(f"DuckDuckGo search error: {str(e)}")
+            logger.error("DuckDuckGo search error: %s", e)
             return []
     
     def _parse_html_results(self, html_content: str) -> List[Dict[str, str]]:
         """
         Parse the HTML response from DuckDuckGo to extract search results.
         
+        Uses selectolax when it is installed and falls back to regex matching otherwise.
+        
         Args:
             html_content: HTML content from DuckDuckGo
             
         Returns:
             List of search results with title, URL, and snippet
         """
+        if not _SELECTOLAX_AVAILABLE:
+            return self._parse_html_results_regex(html_content)
+        
         results = []
         
         try:
-            # Extract titles
-            title_matches = re.findall(r'<a rel="nofollow" class="result__a" href="([^"]+)">([^<]+)</a>', html_content)
-            
-            # Extract snippets
-            snippet_matches = re.findall(r'<a class="result__snippet" href="[^"]+">([^<]+(?:<[^>]+>[^<]+)*)</a>', html_content)
+            tree = LexborHTMLParser(html_content)
             
-            # Process results
-            for i, (url, title) in enumerate(title_matches):
-                snippet = ""
-                if i < len(snippet_matches):
-                    # Remove HTML tags from snippet
-                    snippet = re.sub(r'<[^>]+>', ' ', snippet_matches[i])
-                
-                # Clean up title and snippet
-                title = title.strip()
-                snippet = snippet.strip()
+            for node in tree.css("div.result"):
+                link = node.css_first("a.result__a")
+                if link is None:
+                    continue
                 
-                # Replace HTML entities
-                for entity, char in [('&quot;', '"'), ('&amp;', '&'), ('&lt;', '<'), ('&gt;', '>'), ('&#x27;', "'")]:
-                    title = title.replace(entity, char)
-                    snippet = snippet.replace(entity, char)
+                snippet_node = node.css_first("a.result__snippet")
                 
+                # text() strips nested tags and decodes HTML entities
                 results.append({
-                    "title": title,
-                    "url": url,
-                    "snippet": snippet
+                    "title": link.text(deep=True).strip(),
+                    "url": link.attributes.get("href") or "",
+                    "snippet": snippet_node.text(deep=True).strip() if snippet_node is not None else ""
                 })
             
             return results
         except Exception as e:
-            print(f"Error parsing DuckDuckGo HTML: {str(e)}")
+            logger.error("Error parsing DuckDuckGo HTML: %s", e)
+            return []
+    
+    def _parse_html_results_regex(self, html_content: str) -> List[Dict[str, str]]:
+        """
+        Parse the HTML response from DuckDuckGo with regular expressions.
+        
+        Args:
+            html_content: HTML content from DuckDuckGo
+            
+        Returns:
+            List of search results with title, URL, and snippet
+        """
+        results = []
+        
+        try:
+            # Titles and snippets are matched in a single pass in document order,
+            # so each snippet is attached to the result whose title preceded it
+            for url, title, snippet in _RESULT_PART_RE.findall(html_content):
+                if url:
+                    results.append({
+                        "title": html.unescape(title.strip()),
+                        "url": html.unescape(url),
+                        "snippet": ""
+                    })
+                elif results and not results[-1]["snippet"]:
+                    # Remove HTML tags from snippet
+                    snippet = _TAG_RE.sub(' ', snippet).strip()
+                    results[-1]["snippet"] = html.unescape(snippet)
+            
+            return results
+        except Exception as e:
+            logger.error("Error parsing DuckDuckGo HTML: %s", e)
             return []
     
     def _convert_language(self, language: str) -> str:
@@ -130,20 +195,8 @@ class DuckDuckGoClient:
         Returns:
             DuckDuckGo language code
         """
-        # Map common language codes to DuckDuckGo region codes
-        language_map = {
-            "en-US": "us-en",
-            "en-GB": "uk-en",
-            "en-CA": "ca-en",
-            "fr-FR": "fr-fr",
-            "de-DE": "de-de",
-            "es-ES": "es-es",
-            "it-IT": "it-it",
-            "ja-JP": "jp-jp",
-        }
-        
         # Default to world-wide if not found
-        return language_map.get(language, "wt-wt")
+        return _LANGUAGE_MAP.get(language, "wt-wt")
     
     def _convert_time_range(self, time_range: str) -> str:
         """
@@ -155,10 +208,4 @@ class DuckDuckGoClient:
         Returns:
             DuckDuckGo time range parameter
         """
-        time_map = {
-            "day": "d",
-            "week": "w",
-            "month": "m",
-            "year": "y"
-        }
-        return time_map.get(time_range, "") 
\ No newline at end of file
+        return _TIME_MAP.get(time_range, "") 
\ No newline at end of file
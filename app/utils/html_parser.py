@@ -1,14 +1,291 @@
 import re
-from bs4 import BeautifulSoup
+from collections import deque
+from bs4 import BeautifulSoup, Comment, NavigableString
+from bs4.element import PreformattedString
 import json
-from urllib.parse import urljoin
+from typing import Callable
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# Prefer the libxml2-based parser; fall back to the pure-Python one
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+_HIDDEN_STYLE = re.compile(r'display:\s*none|visibility:\s*hidden')
+_WS = re.compile(r'\s+')
+# Digit runs long enough to be an integer outside orjson's 64-bit range
+_LONG_DIGITS = re.compile(r'\d{19}')
+_MULTI_SPACE = re.compile(r' {2,}')
+_BREAK_SPACES = re.compile(r' *\n *')
+
+# Elements removed from the page together with their content
+_KILL_TAGS = frozenset([
+    'script', 'style', 'svg', 'iframe', 'form', 'noscript', 'canvas', 'video',
+    'audio', 'source',
+])
+
+_HEADING_LEVELS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+
+# Elements whose content starts a new block of text
+_BLOCK_TAGS = frozenset([
+    'address', 'article', 'aside', 'dd', 'details', 'dialog', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'header', 'hgroup', 'li', 'main',
+    'nav', 'p', 'section', 'summary',
+])
+
+# Elements whose content is never part of the page text
+_SKIP_TAGS = frozenset(['head', 'title', 'template'])
+
+# Emphasis markers wrapped around the rendered content of inline elements
+_INLINE_MARKERS = {'strong': '**', 'b': '**', 'em': '*', 'i': '*'}
+
+# Walk phases of a node on the traversal stack
+_ENTER = 0
+_EXIT = 1
+
+
+class _Frame:
+    """Output buffer for an element whose content is rendered as a unit."""
+    
+    __slots__ = ('blocks', 'inline', 'kind', 'ordered', 'depth', 'count', 'lines', 'nested')
+    
+    def __init__(self, kind: str = None, ordered: bool = False, depth: int = 0):
+        self.blocks = []
+        self.inline = []
+        self.kind = kind
+        self.ordered = ordered
+        self.depth = depth
+        self.count = 0
+        self.lines = []
+        self.nested = []
+
+
+# First characters after '//' that mean the href names no host
+_NO_HOST = ('', '/', '?', '#')
+
+
+def _make_url_joiner(base_url: str) -> Callable[[str], str]:
+    """
+    Build a function that resolves hrefs against base_url.
+    
+    The base URL is parsed once. Absolute, protocol-relative and root-relative
+    hrefs that urljoin would return unchanged apart from the base are resolved
+    without going through it; all other hrefs fall back to it, so the result
+    is always the same as urljoin's.
+    """
+    base = urlsplit(base_url)
+    if not base.scheme or not base.netloc:
+        return lambda href: urljoin(base_url, href)
+    
+    scheme = base.scheme
+    origin = f"{scheme}://{base.netloc}"
+    
+    def join(href: str) -> str:
+        # urljoin normalizes dot segments, drops empty queries, fragments and
+        # path parameters, strips whitespace and control characters and
+        # validates bracketed hosts; leave such hrefs to it
+        if (
+            '/.' in href or '?#' in href or ';' in href or '[' in href or ']' in href
+            or href.endswith(('?', '#', ' ')) or not href.isprintable()
+        ):
+            return urljoin(base_url, href)
+        if href.startswith(('http://', 'https://')):
+            # Only hrefs that name a host are absolute
+            host_start = href.index('//') + 2
+            if href[host_start:host_start + 1] not in _NO_HOST:
+                return href
+        elif href.startswith('//'):
+            if href[2:3] not in _NO_HOST:
+                return f"{scheme}:{href}"
+        elif href.startswith('/'):
+            return origin + href
+        return urljoin(base_url, href)
+    
+    return join
+
+
+# Tag handlers for HTMLCleaner._walk. Openers run when an element is entered
+# and return True if its children should be walked; closers run once they have been.
+
+def _open_block(node, frames: list) -> bool:
+    frame = frames[-1]
+    HTMLCleaner._flush(frame.blocks, frame.inline)
+    return True
+
+
+def _open_inline(node, frames: list) -> bool:
+    frames.append(_Frame())
+    return True
+
+
+def _open_container(node, frames: list) -> bool:
+    frame = frames[-1]
+    HTMLCleaner._flush(frame.blocks, frame.inline)
+    frames.append(_Frame())
+    return True
+
+
+def _open_item(node, frames: list) -> bool:
+    frame = frames[-1]
+    HTMLCleaner._flush(frame.blocks, frame.inline)
+    frames.append(_Frame(kind='item'))
+    return True
+
+
+def _open_list(node, frames: list) -> bool:
+    frame = frames[-1]
+    HTMLCleaner._flush(frame.blocks, frame.inline)
+    depth = sum(1 for f in frames if f.kind == 'list')
+    frames.append(_Frame(kind='list', ordered=node.name == 'ol', depth=depth))
+    return True
+
+
+def _open_code(node, frames: list) -> bool:
+    text = HTMLCleaner._clean_text(node.get_text())
+    if text:
+        frames[-1].inline.append(f"`{text}`")
+    return False
+
+
+def _open_br(node, frames: list) -> bool:
+    frames[-1].inline.append('\n')
+    return False
+
+
+def _open_hr(node, frames: list) -> bool:
+    frame = frames[-1]
+    HTMLCleaner._flush(frame.blocks, frame.inline)
+    frame.blocks.append('---')
+    return False
+
+
+def _open_pre(node, frames: list) -> bool:
+    frame = frames[-1]
+    HTMLCleaner._flush(frame.blocks, frame.inline)
+    text = node.get_text().strip('\n')
+    if text.strip():
+        frame.blocks.append(f"```\n{text}\n```")
+    return False
+
+
+def _open_table(node, frames: list) -> bool:
+    frame = frames[-1]
+    HTMLCleaner._flush(frame.blocks, frame.inline)
+    table = HTMLCleaner._render_table(node)
+    if table:
+        frame.blocks.append(table)
+    return False
+
+
+def _open_skip(node, frames: list) -> bool:
+    return False
+
+
+def _close_block(node, frames: list) -> None:
+    frame = frames[-1]
+    HTMLCleaner._flush(frame.blocks, frame.inline)
+
+
+def _close_marker(node, frames: list) -> None:
+    text = HTMLCleaner._frame_text(frames.pop())
+    if text:
+        marker = _INLINE_MARKERS[node.name]
+        frames[-1].inline.append(f"{marker}{text}{marker}")
+
+
+def _close_link(node, frames: list) -> None:
+    text = HTMLCleaner._frame_text(frames.pop())
+    href = node.get('href')
+    if text and href:
+        frames[-1].inline.append(f"[{text}]({href})")
+    elif text:
+        frames[-1].inline.append(text)
+
+
+def _close_heading(node, frames: list) -> None:
+    text = HTMLCleaner._frame_text(frames.pop())
+    if text:
+        frames[-1].blocks.append(f"{'#' * _HEADING_LEVELS[node.name]} {text}")
+
+
+def _close_blockquote(node, frames: list) -> None:
+    quoted = frames.pop()
+    HTMLCleaner._flush(quoted.blocks, quoted.inline)
+    if quoted.blocks:
+        lines = '\n\n'.join(quoted.blocks).split('\n')
+        frames[-1].blocks.append('\n'.join(f"> {line}" if line else '>' for line in lines))
+
+
+def _close_item(node, frames: list) -> None:
+    item = frames.pop()
+    parent = frames[-1]
+    if parent.kind == 'list':
+        text = HTMLCleaner._frame_text(item)
+        parent.count += 1
+        marker = f"{parent.count}." if parent.ordered else '*'
+        parent.lines.append(f"{'  ' * parent.depth}{marker} {text}".rstrip())
+        parent.lines.extend(item.nested)
+    else:
+        # Stray <li> outside a list is treated as a plain block
+        HTMLCleaner._flush(item.blocks, item.inline)
+        parent.blocks.extend(item.blocks)
+        if item.nested:
+            parent.blocks.append('\n'.join(item.nested))
+
+
+def _close_list(node, frames: list) -> None:
+    lines = frames.pop().lines
+    parent = frames[-1]
+    if parent.kind == 'item':
+        # Nested list, rendered below the item that contains it
+        HTMLCleaner._flush(parent.blocks, parent.inline)
+        parent.nested.extend(lines)
+    elif lines:
+        parent.blocks.append('\n'.join(lines))
+
+
+_OPEN_HANDLERS = {
+    **dict.fromkeys(_BLOCK_TAGS, _open_block),
+    **dict.fromkeys(_INLINE_MARKERS, _open_inline),
+    **dict.fromkeys(_HEADING_LEVELS, _open_container),
+    **dict.fromkeys(_SKIP_TAGS, _open_skip),
+    'a': _open_inline,
+    'blockquote': _open_container,
+    'li': _open_item,
+    'ul': _open_list,
+    'ol': _open_list,
+    'code': _open_code,
+    'br': _open_br,
+    'hr': _open_hr,
+    'pre': _open_pre,
+    'table': _open_table,
+}
+
+_CLOSE_HANDLERS = {
+    **dict.fromkeys(_BLOCK_TAGS, _close_block),
+    **dict.fromkeys(_INLINE_MARKERS, _close_marker),
+    **dict.fromkeys(_HEADING_LEVELS, _close_heading),
+    'a': _close_link,
+    'blockquote': _close_blockquote,
+    'li': _close_item,
+    'ul': _close_list,
+    'ol': _close_list,
+}
 
 
 class HTMLCleaner:
     """HTML cleaner and converter for content retrieval."""
 
     @staticmethod
-    async def clean_html(html_content: str, base_url: str = '') -> BeautifulSoup:
+    def clean_html(html_content: str, base_url: str = '') -> BeautifulSoup:
         """
         Clean HTML by removing unnecessary elements.
         
@@ -20,37 +297,44 @@ class HTMLCleaner:
             BeautifulSoup object with clean HTML
         """
         # Create BeautifulSoup object
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _HTML_PARSER)
+        
+        join_url = _make_url_joiner(base_url)
         
-        # Remove script, style, svg, img, iframe, form elements
-        for element in soup.find_all(['script', 'style', 'svg', 'iframe', 'form', 
-                                     'noscript', 'canvas', 'video', 'audio', 'source']):
-            element.decompose()
+        # Snapshot the nodes first, since the tree is modified while walking it
+        for node in list(soup.descendants):
+            # Skip nodes inside a subtree that was already removed
+            if node.decomposed:
+                continue
             
-        # Remove comments
-        for comment in soup.find_all(string=lambda text: isinstance(text, str) and '<!--' in text):
-            comment.extract()
+            if isinstance(node, NavigableString):
+                # Remove comments
+                if isinstance(node, Comment):
+                    node.extract()
+                continue
             
-        # Remove hidden elements
-        for hidden in soup.find_all(style=re.compile(r'display:\s*none|visibility:\s*hidden')):
-            hidden.decompose()
+            name = node.name
             
-        # Make all URLs absolute for better context
-        for a_tag in soup.find_all('a', href=True):
-            a_tag['href'] = urljoin(base_url, a_tag['href'])
-        
-        # Replace img tags with their alt text or a placeholder
-        for img in soup.find_all('img'):
-            alt_text = img.get('alt', '')
-            if alt_text:
-                img.replace_with(f"[Image: {alt_text}]")
-            else:
-                img.replace_with("[Image]")
+            # Remove script, style, svg, iframe, form elements and hidden elements
+            if name in _KILL_TAGS or _HIDDEN_STYLE.search(node.get('style', '')):
+                node.decompose()
+            
+            # Make all URLs absolute for better context
+            elif name == 'a' and node.has_attr('href'):
+                node['href'] = join_url(node['href'])
+            
+            # Replace img tags with their alt text or a placeholder
+            elif name == 'img':
+                alt_text = node.get('alt', '')
+                if alt_text:
+                    node.replace_with(f"[Image: {alt_text}]")
+                else:
+                    node.replace_with("[Image]")
             
         return soup
     
     @staticmethod
-    async def extract_title(soup: BeautifulSoup) -> str:
+    def extract_title(soup: BeautifulSoup) -> str:
         """Extract the title from HTML."""
         if soup.title:
             return soup.title.string.strip()
@@ -63,10 +347,14 @@ class HTMLCleaner:
         return "No title found"
     
     @staticmethod
-    async def html_to_markdown(soup: BeautifulSoup) -> str:
+    def html_to_markdown(soup: BeautifulSoup) -> str:
         """
         Convert cleaned HTML to markdown.
         
+        The tree is walked once and markdown is emitted directly from it;
+        paragraphs, headings, lists and tables become blocks separated by
+        blank lines.
+        
         Args:
             soup: BeautifulSoup object with cleaned HTML
             
@@ -79,158 +367,118 @@ class HTMLCleaner:
         if not main_content:
             main_content = soup
         
-        # Process tables first, as they require special handling
-        markdown_content = await HTMLCleaner._convert_tables(main_content)
-        
-        # Process other elements
-        markdown_content = await HTMLCleaner._convert_content(markdown_content)
-        
-        return markdown_content.strip()
+        return HTMLCleaner._walk(main_content)
     
     @staticmethod
-    async def _convert_tables(content):
-        """Convert HTML tables to markdown tables."""
-        soup = content
-        if isinstance(content, str):
-            soup = BeautifulSoup(content, 'html.parser')
+    def _walk(root) -> str:
+        """
+        Walk the tree under root with an explicit stack and emit markdown.
+        
+        Each element is handled by the functions registered for its tag in
+        _OPEN_HANDLERS and _CLOSE_HANDLERS: on enter it opens an output frame
+        or emits its opening markup, on exit it closes it. This avoids Python
+        recursion, so deeply nested pages cannot hit the recursion limit.
+        """
+        frames = [_Frame()]
+        stack = deque((child, _ENTER) for child in reversed(root.contents))
         
-        for table in soup.find_all('table'):
-            markdown_table = []
+        while stack:
+            node, phase = stack.pop()
             
-            # Extract headers
-            headers = []
-            header_row = table.find('thead')
-            if header_row:
-                for th in header_row.find_all(['th']):
-                    headers.append(th.get_text().strip())
+            if phase == _EXIT:
+                _CLOSE_HANDLERS[node.name](node, frames)
+            elif isinstance(node, NavigableString):
+                # Comments, doctypes and CDATA sections are not content
+                if not isinstance(node, PreformattedString):
+                    frames[-1].inline.append(_WS.sub(' ', node))
             else:
-                # Try to get headers from first row
-                first_row = table.find('tr')
-                if first_row:
-                    for th in first_row.find_all(['th', 'td']):
-                        headers.append(th.get_text().strip())
-            
-            if headers:
-                markdown_table.append('| ' + ' | '.join(headers) + ' |')
-                markdown_table.append('| ' + ' | '.join(['---' for _ in headers]) + ' |')
-            
-            # Extract rows
-            for tr in table.find_all('tr'):
-                # Skip header row if we've already processed it
-                if tr == header_row or (not header_row and tr == table.find('tr') and any(tr.find_all('th'))):
-                    continue
-                
-                row_data = []
-                for td in tr.find_all(['td', 'th']):
-                    row_data.append(td.get_text().strip())
-                
-                if row_data:
-                    markdown_table.append('| ' + ' | '.join(row_data) + ' |')
-            
-            # Replace the table with markdown
-            if markdown_table:
-                table_markdown = '\n'.join(markdown_table)
-                table.replace_with(BeautifulSoup(f"<div>{table_markdown}</div>", 'html.parser'))
-        
-        return str(soup)
+                name = node.name
+                opener = _OPEN_HANDLERS.get(name)
+                if opener is None or opener(node, frames):
+                    # Only elements with closing markup need an exit visit
+                    if name in _CLOSE_HANDLERS:
+                        stack.append((node, _EXIT))
+                    stack.extend((child, _ENTER) for child in reversed(node.contents))
+        
+        root_frame = frames[0]
+        HTMLCleaner._flush(root_frame.blocks, root_frame.inline)
+        return '\n\n'.join(root_frame.blocks)
     
     @staticmethod
-    async def _convert_content(html_content: str) -> str:
-        """
-        Convert HTML content to markdown with more robust handling.
-        
-        Args:
-            html_content: HTML content as string
-            
-        Returns:
-            Markdown content
-        """
-        # Convert headers
-        for i in range(6, 0, -1):
-            html_content = re.sub(f'<h{i}[^>]*>(.*?)</h{i}>', lambda m: f"{'#' * i} {HTMLCleaner._clean_text(m.group(1))}\n\n", html_content, flags=re.DOTALL)
-        
-        # Convert paragraphs
-        html_content = re.sub(r'<p[^>]*>(.*?)</p>', lambda m: f"{HTMLCleaner._clean_text(m.group(1))}\n\n", html_content, flags=re.DOTALL)
-        
-        # Convert blockquotes
-        html_content = re.sub(r'<blockquote[^>]*>(.*?)</blockquote>', lambda m: '\n'.join([f"> {line}" for line in HTMLCleaner._clean_text(m.group(1)).split('\n')]) + '\n\n', html_content, flags=re.DOTALL)
-        
-        # Convert code blocks
-        html_content = re.sub(r'<pre[^>]*><code[^>]*>(.*?)</code></pre>', lambda m: f"```\n{HTMLCleaner._clean_text(m.group(1))}\n```\n\n", html_content, flags=re.DOTALL)
-        html_content = re.sub(r'<pre[^>]*>(.*?)</pre>', lambda m: f"```\n{HTMLCleaner._clean_text(m.group(1))}\n```\n\n", html_content, flags=re.DOTALL)
-        
-        # Convert inline code
-        html_content = re.sub(r'<code[^>]*>(.*?)</code>', lambda m: f"`{HTMLCleaner._clean_text(m.group(1))}`", html_content, flags=re.DOTALL)
-        
-        # Convert strong/bold
-        html_content = re.sub(r'<(strong|b)[^>]*>(.*?)</\1>', lambda m: f"**{HTMLCleaner._clean_text(m.group(2))}**", html_content, flags=re.DOTALL)
-        
-        # Convert em/italic
-        html_content = re.sub(r'<(em|i)[^>]*>(.*?)</\1>', lambda m: f"*{HTMLCleaner._clean_text(m.group(2))}*", html_content, flags=re.DOTALL)
-        
-        # Convert lists
-        # First handle unordered lists
-        html_content = re.sub(r'<ul[^>]*>(.*?)</ul>', lambda m: HTMLCleaner._process_list(m.group(1), ordered=False), html_content, flags=re.DOTALL)
-        
-        # Then handle ordered lists
-        html_content = re.sub(r'<ol[^>]*>(.*?)</ol>', lambda m: HTMLCleaner._process_list(m.group(1), ordered=True), html_content, flags=re.DOTALL)
-        
-        # Convert links
-        html_content = re.sub(r'<a [^>]*href=[\'"]([^\'"]*)[\'"][^>]*>(.*?)</a>', lambda m: f"[{HTMLCleaner._clean_text(m.group(2))}]({m.group(1)})", html_content, flags=re.DOTALL)
-        
-        # Convert horizontal rules
-        html_content = re.sub(r'<hr[^>]*>', '\n---\n\n', html_content)
-        
-        # Strip remaining HTML tags
-        html_content = re.sub(r'<[^>]+>', '', html_content)
-        
-        # Handle HTML entities
-        html_content = html_content.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&').replace('&quot;', '"').replace('&nbsp;', ' ')
-        
-        # Clean up excessive whitespace
-        html_content = re.sub(r'\n{3,}', '\n\n', html_content)
-        
-        return html_content
+    def _flush(blocks: list, inline: list) -> None:
+        """Close the pending inline fragments into a block."""
+        if not inline:
+            return
+        text = ''.join(inline)
+        inline.clear()
+        # Line breaks come from <br>; all other whitespace is already collapsed
+        text = _BREAK_SPACES.sub('\n', _MULTI_SPACE.sub(' ', text)).strip()
+        if text:
+            blocks.append(text)
     
     @staticmethod
-    def _process_list(list_content, ordered=False):
-        """Process list items to proper markdown format."""
-        # Extract list items
-        items = re.findall(r'<li[^>]*>(.*?)</li>', list_content, flags=re.DOTALL)
-        
-        markdown_items = []
-        for i, item in enumerate(items, 1):
-            if ordered:
-                markdown_items.append(f"{i}. {HTMLCleaner._clean_text(item)}")
-            else:
-                markdown_items.append(f"* {HTMLCleaner._clean_text(item)}")
-        
-        return '\n'.join(markdown_items) + '\n\n'
+    def _frame_text(frame: "_Frame") -> str:
+        """Render a frame's content as a single line of markdown."""
+        HTMLCleaner._flush(frame.blocks, frame.inline)
+        return ' '.join(frame.blocks)
+    
+    
+    @staticmethod
+    def _render_table(table) -> str:
+        """Render a <table> as a markdown table, using its first row as the header."""
+        rows = []
+        for tr in table.find_all('tr'):
+            cells = [
+                HTMLCleaner._clean_text(cell.get_text()).replace('|', '\\|')
+                for cell in tr.find_all(['th', 'td'], recursive=False)
+            ]
+            if cells:
+                rows.append(cells)
+        
+        if not rows:
+            return ''
+        
+        width = max(len(row) for row in rows)
+        lines = []
+        for i, row in enumerate(rows):
+            row = row + [''] * (width - len(row))
+            lines.append('| ' + ' | '.join(row) + ' |')
+            if i == 0:
+                lines.append('| ' + ' | '.join(['---'] * width) + ' |')
+        
+        return '\n'.join(lines)
+    
     
     @staticmethod
     def _clean_text(text):
         """Clean text content by removing extra whitespace."""
         # Remove newlines and extra spaces
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS.sub(' ', text).strip()
         return text
     
     @classmethod
-    async def process_html(cls, html_content: str, content_type: str = "text/html", base_url: str = '',) -> dict:
+    def process_html(cls, html_content: str, content_type: str = "text/html", base_url: str = '', pretty_json: bool = True) -> dict:
         """
         Process HTML content into clean format with title and content.
         
         Args:
             html_content: Raw HTML content
             base_url: Base URL for resolving relative links
+            pretty_json: Re-indent JSON documents for markdown output
             
         Returns:
             Dictionary with title, url and content
         """
         if 'text/html' not in content_type:
-            return await cls.clean_nonhtml(content, content_type, base_url)
-        soup = await cls.clean_html(html_content, base_url)
-        title = await cls.extract_title(soup)
-        content = await cls.html_to_markdown(soup)
+            return cls.clean_nonhtml(html_content, content_type, base_url, pretty_json)
+        # Mislabelled plain text has no markup to parse, so skip BeautifulSoup.
+        # The whole document is searched, since pages can start with any amount
+        # of blank lines or text before their first tag; the scan runs in C
+        if '<' not in html_content:
+            return cls.clean_nonhtml(html_content, 'text/plain', base_url, pretty_json)
+        soup = cls.clean_html(html_content, base_url)
+        title = cls.extract_title(soup)
+        content = cls.html_to_markdown(soup)
         
         return {
             "title": title,
@@ -239,8 +487,13 @@ class HTMLCleaner:
         }
     
     @staticmethod
-    async def clean_nonhtml(content, content_type, url) -> dict:
-        """Extract text content from non-HTML sources."""
+    def clean_nonhtml(content, content_type, url, pretty_json: bool = True) -> dict:
+        """
+        Extract text content from non-HTML sources.
+        
+        JSON documents are re-indented only when pretty_json is set; otherwise
+        the original text is kept, which avoids a second serialization pass.
+        """
         # Basic processing for plain text
         if 'text/plain' in content_type:
             lines = content.split('\n')
@@ -262,9 +515,24 @@ class HTMLCleaner:
         # Basic processing for JSON
         elif 'application/json' in content_type:
             try:
-                # Try to parse JSON and pretty-print it
-                json_data = json.loads(content)
-                formatted_json = json.dumps(json_data, indent=2)
+                # Try to parse JSON and, if requested, pretty-print it. orjson turns
+                # integers wider than 64 bits into floats and rejects NaN and
+                # Infinity, so those documents go through the json module instead
+                use_orjson = _ORJSON_AVAILABLE and not _LONG_DIGITS.search(content)
+                if use_orjson:
+                    try:
+                        json_data = orjson.loads(content)
+                    except orjson.JSONDecodeError:
+                        use_orjson = False
+                if not use_orjson:
+                    json_data = json.loads(content)
+                
+                if not pretty_json:
+                    formatted_json = content.strip()
+                elif use_orjson:
+                    formatted_json = orjson.dumps(json_data, option=orjson.OPT_INDENT_2).decode()
+                else:
+                    formatted_json = json.dumps(json_data, indent=2)
                 
                 # Try to find a title in common JSON fields
                 title = "JSON Document"
@@ -288,8 +556,13 @@ class HTMLCleaner:
         
         # For other formats, return a simple representation
         else:
+            truncated = len(content) > 5000
+            snippet = content[:5000] if truncated else content
+            body = f"Content type '{content_type}' not fully supported. Raw content:\n\n```\n{snippet}\n```"
+            if truncated:
+                body += "\n\n(Content may be truncated)"
             return {
                 "title": f"Document ({content_type})",
                 "url": url,
-                "content": f"Content type '{content_type}' not fully supported. Raw content:\n\n```\n{content[:5000]}\n```\n\n(Content may be truncated)"
+                "content": body
             }
\ No newline at end of file
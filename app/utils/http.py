@@ -0,0 +1,40 @@
+import aiohttp
+from typing import Optional
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the process-wide aiohttp session, creating it on first use.
+
+    Sharing one session keeps connections alive between requests, so repeat
+    calls to the same host skip DNS resolution and the TCP/TLS handshake.
+    Callers pass their own ClientTimeout per request.
+
+    The session keeps no cookies. It is shared by every API caller, so a
+    cookie jar would replay one caller's cookies on another caller's
+    requests, as well as grow with every site ever read. Each request
+    therefore goes out without cookies, as it did with per-call sessions.
+
+    Returns:
+        The shared aiohttp.ClientSession
+    """
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        _session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session, if one was created."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
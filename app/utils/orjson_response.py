@@ -0,0 +1,19 @@
+from typing import Any
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, falling back to the stdlib encoder."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if not _ORJSON_AVAILABLE:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
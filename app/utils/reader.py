@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Tuple
+from app.core.config import settings
+from app.utils.cache import LRUCache, SingleFlight
+from app.utils.web_fetcher import WebFetcher
+from app.utils.html_parser import HTMLCleaner
+
+logger = logging.getLogger(__name__)
+
+# Processed pages can be several MB of markdown each, so the cache is also
+# bounded by the total length of the cached content
+_read_cache = LRUCache(
+    max_size=settings.read.cache_max_size,
+    ttl=settings.read.cache_ttl,
+    max_bytes=settings.read.cache_max_mb * 1024 * 1024,
+    sizeof=lambda processed: len(processed["content"])
+)
+_inflight = SingleFlight()
+
+# Downloads are cached separately, so reading a URL in both output formats fetches
+# it once. Bodies can be up to MAX_CONTENT_SIZE each, so the cache is also bounded
+# by the total length of the cached content
+_fetch_cache = LRUCache(
+    max_size=settings.read.fetch_cache_max_size,
+    ttl=settings.read.fetch_cache_ttl,
+    max_bytes=settings.read.fetch_cache_max_mb * 1024 * 1024,
+    sizeof=lambda result: len(result[0])
+)
+_fetch_inflight = SingleFlight()
+
+# Pages at least this many characters long are processed in a worker process
+_POOL_THRESHOLD = 256_000
+
+# Workers are not forked from the server process, which runs DNS resolver
+# threads by the time the first large page arrives; forkserver is not
+# available on Windows
+_POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+async def read_page(url: str, pretty_json: bool = True) -> Optional[dict]:
+    """
+    Fetch and process a URL, reusing the processed result for recently read URLs.
+    
+    Concurrent reads of the same URL share a single fetch. Only JSON documents
+    are processed differently per output format; everything else is cached
+    once per URL and shared by both formats.
+    
+    Args:
+        url: Absolute URL to read
+        pretty_json: Re-indent JSON documents, only needed for markdown output
+        
+    Returns:
+        Dictionary with title, url and content, or None if the fetch failed
+    """
+    processed = _read_cache.get((url, None)) or _read_cache.get((url, pretty_json))
+    if processed is not None:
+        return processed
+    
+    return await _inflight.do((url, pretty_json), lambda: _fetch_and_process(url, pretty_json))
+
+
+def close_parse_pool() -> None:
+    """Shut down the worker processes used for large pages, if they were started."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+    _parse_pool = None
+
+
+async def _fetch_and_process(url: str, pretty_json: bool) -> Optional[dict]:
+    """Fetch a URL, convert it to clean content and cache the result."""
+    result = await _fetch(url)
+    if not result:
+        return None
+    
+    content, content_type = result
+    if _depends_on_format(content_type):
+        key = (url, pretty_json)
+    else:
+        key = (url, None)
+        # A read in the other format may have processed it meanwhile
+        processed = _read_cache.get(key)
+        if processed is not None:
+            return processed
+    
+    processed = await _process(content, content_type, url, pretty_json)
+    _read_cache.set(key, processed)
+    return processed
+
+
+def _depends_on_format(content_type: str) -> bool:
+    """Whether process_html's output for this content type depends on pretty_json."""
+    # Mirrors the branches of process_html/clean_nonhtml: only JSON is re-indented
+    return (
+        'application/json' in content_type
+        and 'text/html' not in content_type
+        and 'text/plain' not in content_type
+    )
+
+
+async def _process(content: str, content_type: str, url: str, pretty_json: bool) -> dict:
+    """
+    Convert fetched content, moving large pages off the event loop.
+    
+    Parsing is CPU-bound and holds the GIL, so a large page would stall every
+    other request; those are handed to a process pool instead.
+    """
+    global _parse_pool
+    if len(content) < _POOL_THRESHOLD:
+        return HTMLCleaner.process_html(content, content_type, url, pretty_json)
+    
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context(_POOL_START_METHOD)
+        )
+    
+    # process_html pickles as a reference to app.utils.html_parser, so workers
+    # only need that module to run it
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_parse_pool, HTMLCleaner.process_html, content, content_type, url, pretty_json)
+    except BrokenProcessPool as e:
+        # A worker died (e.g. killed for memory); start a fresh pool next time
+        logger.error("Parse worker failed for %s, processing inline: %s", url, e)
+        _parse_pool = None
+        return HTMLCleaner.process_html(content, content_type, url, pretty_json)
+
+
+async def _fetch(url: str) -> Optional[Tuple[str, str]]:
+    """Fetch a URL, reusing a recent download and joining an in-flight one."""
+    result = _fetch_cache.get(url)
+    if result is not None:
+        return result
+    
+    return await _fetch_inflight.do(url, lambda: _fetch_and_cache(url))
+
+
+async def _fetch_and_cache(url: str) -> Optional[Tuple[str, str]]:
+    """Fetch a URL and cache successful downloads."""
+    result = await WebFetcher.fetch_url(url)
+    if result:
+        _fetch_cache.set(url, result)
+    return result
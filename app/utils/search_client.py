@@ -1,21 +1,37 @@
+import logging
 from app.core.config import settings, SearchProvider
 from app.utils.searx import SearXNGClient
 from app.utils.duckduckgo import DuckDuckGoClient
 from app.utils.brave import BraveSearchClient
+from app.utils.cache import LRUCache, SingleFlight
 from typing import Union
 
+logger = logging.getLogger(__name__)
+
 
 class SearchClientFactory:
     """Factory for creating search client instances based on configuration."""
     
-    @staticmethod
-    def get_client() -> Union[SearXNGClient, DuckDuckGoClient, BraveSearchClient]:
+    _client = None
+    
+    @classmethod
+    def get_client(cls) -> Union[SearXNGClient, DuckDuckGoClient, BraveSearchClient]:
         """
         Get the appropriate search client based on the configured provider.
         
+        The client is created on first use and reused afterwards, so its
+        settings are only read once.
+        
         Returns:
             A search client instance based on configuration
         """
+        if cls._client is None:
+            cls._client = cls._create_client()
+        return cls._client
+    
+    @staticmethod
+    def _create_client() -> Union[SearXNGClient, DuckDuckGoClient, BraveSearchClient]:
+        """Create a new search client for the configured provider."""
         provider = settings.search.provider
         
         if provider == SearchProvider.SEARXNG:
@@ -26,5 +42,45 @@ class SearchClientFactory:
             return BraveSearchClient()
         else:
             # Default to SearXNG if provider is not recognized
-            print(f"WARNING: Unknown search provider '{provider}', using SearXNG instead")
-            return SearXNGClient() 
\ No newline at end of file
+            logger.warning("Unknown search provider '%s', using SearXNG instead", provider)
+            return SearXNGClient()
+
+
+_search_cache = LRUCache(max_size=settings.search.cache_max_size, ttl=settings.search.cache_ttl)
+_inflight = SingleFlight()
+
+
+async def cached_search(query: str, num_results: int = None, language: str = None, time_range: str = None) -> list:
+    """
+    Search with the configured provider, reusing recent results for identical queries.
+    
+    Concurrent identical searches share a single upstream request. Empty result
+    lists are not cached, since clients also return them on errors.
+    
+    Args:
+        query: The search query
+        num_results: Number of results to return, defaults to the provider's max_results
+        language: Language code for search results (e.g., en-US, fr-FR)
+        time_range: Optional time filter (day, week, month, year)
+        
+    Returns:
+        List of search results
+    """
+    key = (settings.search.provider, query, num_results, language, time_range)
+    results = _search_cache.get(key)
+    if results is not None:
+        return results
+    
+    return await _inflight.do(
+        key, lambda: _search_and_cache(key, query, num_results, language, time_range)
+    )
+
+
+async def _search_and_cache(key: tuple, query: str, num_results: int, language: str, time_range: str) -> list:
+    """Run a search against the configured provider and cache non-empty results."""
+    results = await SearchClientFactory.get_client().search(
+        query, num_results=num_results, language=language, time_range=time_range
+    )
+    if results:
+        _search_cache.set(key, results)
+    return results
@@ -1,6 +1,16 @@
+import logging
 import aiohttp
 import json
 from app.core.config import settings
+from app.utils.http import get_session
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 
 class SearXNGClient:
@@ -9,6 +19,8 @@ class SearXNGClient:
     def __init__(self):
         """Initialize SearXNG client with configured settings."""
         self.instance_url = settings.searxng.instance_url
+        self.default_max_results = settings.searxng.max_results
+        self._timeout = aiohttp.ClientTimeout(total=settings.searxng.timeout)
         self.auth = None
         
         # Configure authentication if provided
@@ -32,7 +44,7 @@ class SearXNGClient:
             List of search results
         """
         if num_results is None:
-            num_results = settings.searxng.max_results
+            num_results = self.default_max_results
         
         if language is None:
             language = "en-US"
@@ -40,7 +52,7 @@ class SearXNGClient:
         # Validate time_range parameter if provided
         valid_time_ranges = [None, "day", "week", "month", "year"]
         if time_range not in valid_time_ranges:
-            print(f"Warning: Invalid time_range '{time_range}', ignoring parameter")
+            logger.warning("Invalid time_range '%s', ignoring parameter", time_range)
             time_range = None
         
         # Prepare search parameters
@@ -54,51 +66,48 @@ class SearXNGClient:
         if time_range:
             params["time_range"] = time_range
         
-        # Set up timeout
-        timeout = aiohttp.ClientTimeout(total=settings.searxng.timeout)
-        
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                # Create search URL
-                search_url = f"{self.instance_url}/search"
+            session = await get_session()
+            
+            # Create search URL
+            search_url = f"{self.instance_url}/search"
+            
+            # Make the request; credentials go on the request, not the shared session
+            async with session.get(
+                search_url, 
+                params=params, 
+                auth=self.auth,
+                headers={"Accept": "application/json"},
+                timeout=self._timeout
+            ) as response:
+                if response.status != 200:
+                    # Only the start of the body is logged, so don't buffer the rest
+                    raw = await response.content.read(512)
+                    error_text = raw.decode("utf-8", "replace")
+                    logger.error("SearXNG error: Status %s, Response: %s", response.status, error_text[:200])
+                    raise ValueError(f"SearXNG search failed with status code: {response.status}")
                 
+                raw = await response.read()
                 try:
-                    # Make the request
-                    async with session.get(
-                        search_url, 
-                        params=params, 
-                        auth=self.auth,
-                        headers={"Accept": "application/json"}
-                    ) as response:
-                        if response.status != 200:
-                            error_text = await response.text()
-                            print(f"SearXNG error: Status {response.status}, Response: {error_text[:200]}")
-                            raise ValueError(f"SearXNG search failed with status code: {response.status}")
-                        
-                        try:
-                            response_data = await response.json()
-                        except Exception as e:
-                            error_text = await response.text()
-                            print(f"Failed to parse SearXNG JSON response: {str(e)}")
-                            print(f"Response text: {error_text[:200]}")
-                            return []
-                        
-                        # Process and normalize results
-                        results = []
-                        for result in response_data.get("results", []):
-                            # Keep only necessary fields
-                            results.append({
-                                "title": result.get("title", ""),
-                                "url": result.get("url", ""),
-                                "snippet": result.get("content", "")
-                            })
-                        
-                        return results[:num_results]
-                except aiohttp.ClientError as e:
-                    print(f"SearXNG connection error: {str(e)}")
+                    response_data = orjson.loads(raw) if _ORJSON_AVAILABLE else json.loads(raw)
+                except ValueError as e:
+                    logger.error("Failed to parse SearXNG JSON response: %s", e)
+                    logger.debug("Response text: %s", raw[:200].decode("utf-8", "replace"))
                     return []
                 
+                # Keep only necessary fields, trimming before any dicts are built
+                return [
+                    {
+                        "title": result.get("title", ""),
+                        "url": result.get("url", ""),
+                        "snippet": result.get("content", "")
+                    }
+                    for result in response_data.get("results", ())[:num_results]
+                ]
+                
+        except aiohttp.ClientError as e:
+            logger.error("SearXNG connection error: %s", e)
+            return []
         except Exception as e:
-            # In a production environment, you would want to log this error
-            print(f"SearXNG search error: {str(e)}")
+            logger.error("SearXNG search error: %s", e)
             return []
\ No newline at end of file
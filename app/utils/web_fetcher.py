@@ -2,6 +2,7 @@ import aiohttp
 from typing import Optional, Tuple, Union
 from urllib.parse import urlparse
 import logging
+from app.utils.http import get_session
 
 try:
     import brotli  # noqa: F401
@@ -9,11 +10,14 @@ try:
 except ImportError:
     _BROTLI_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class WebFetcher:
     """Utility for fetching web content."""
     
     MAX_CONTENT_SIZE = 10 * 1024 * 1024
+    CHUNK_SIZE = 64 * 1024
     
     TEXT_CONTENT_TYPES = [
         'text/html', 
@@ -59,60 +63,75 @@ class WebFetcher:
         }
         
         try:
-            async with aiohttp.ClientSession(timeout=timeout_obj) as session:
-                try:
-                    async with session.get(url, headers=headers, allow_redirects=True) as response:
-                        if response.status != 200:
-                            logging.warning(f"Failed to fetch {url}: Status code {response.status}")
-                            return None
-                        
-                        # Get content type and check if it's binary or text
-                        content_type = response.headers.get('Content-Type', '').split(';')[0].lower()
-                        
-                        # Check content length if available
-                        content_length = response.headers.get('Content-Length')
-                        if content_length and int(content_length) > WebFetcher.MAX_CONTENT_SIZE:
-                            logging.warning(f"Content too large: {url} ({content_length} bytes)")
-                            return (
-                                f"Content too large to process (size: {content_length} bytes, max: {WebFetcher.MAX_CONTENT_SIZE} bytes)",
-                                'text/plain'
-                            )
+            # The shared session keeps no cookies, so nothing set by one
+            # caller's page is sent along with another caller's fetch
+            session = await get_session()
+            
+            try:
+                async with session.get(url, headers=headers, timeout=timeout_obj, allow_redirects=True) as response:
+                    if response.status != 200:
+                        logger.warning("Failed to fetch %s: Status code %s", url, response.status)
+                        return None
+                    
+                    # Get content type and check if it's binary or text
+                    content_type = response.headers.get('Content-Type', '').split(';')[0].lower()
+                    
+                    # Check content length if available
+                    content_length = response.headers.get('Content-Length')
+                    if content_length and int(content_length) > WebFetcher.MAX_CONTENT_SIZE:
+                        logger.warning("Content too large: %s (%s bytes)", url, content_length)
+                        return (
+                            f"Content too large to process (size: {content_length} bytes, max: {WebFetcher.MAX_CONTENT_SIZE} bytes)",
+                            'text/plain'
+                        )
+                    
+                    # Determine if content is text-based or binary
+                    is_text = any(text_type in content_type for text_type in WebFetcher.TEXT_CONTENT_TYPES)
+                    
+                    if is_text:
+                        # Read the body in chunks so the size cap also holds when
+                        # the server sends no (or a wrong) Content-Length
+                        body = bytearray()
+                        async for chunk in response.content.iter_chunked(WebFetcher.CHUNK_SIZE):
+                            body.extend(chunk)
+                            if len(body) > WebFetcher.MAX_CONTENT_SIZE:
+                                logger.warning("Content too large: %s (over %s bytes)", url, WebFetcher.MAX_CONTENT_SIZE)
+                                return (
+                                    f"Content too large to process (size: over {WebFetcher.MAX_CONTENT_SIZE} bytes, max: {WebFetcher.MAX_CONTENT_SIZE} bytes)",
+                                    'text/plain'
+                                )
                         
-                        # Determine if content is text-based or binary
-                        is_text = any(text_type in content_type for text_type in WebFetcher.TEXT_CONTENT_TYPES)
+                        # Decode once, replacing invalid bytes instead of failing
+                        try:
+                            content = body.decode(response.charset or 'utf-8', errors='replace')
+                        except LookupError:
+                            logger.warning("Unknown charset %r for %s, decoding as UTF-8", response.charset, url)
+                            content = body.decode('utf-8', errors='replace')
+                    else:
+                        # For binary content, just return a message. The body is never
+                        # read, so leaving the block drops the connection instead of
+                        # downloading it
+                        content = f"Binary content type detected: {content_type}. This content type is not supported for processing."
+                        content_type = 'text/plain'
                         
-                        if is_text:
-                            # Get content as text
-                            try:
-                                content = await response.text()
-                            except UnicodeDecodeError:
-                                # Fallback if text decoding fails
-                                logging.warning(f"Unicode decode error for {url}")
-                                content = f"Failed to decode content as text (content-type: {content_type})"
-                                content_type = 'text/plain'
-                        else:
-                            # For binary content, just return a message
-                            content = f"Binary content type detected: {content_type}. This content type is not supported for processing."
-                            content_type = 'text/plain'
-                            
-                        return (content, content_type)
-                except aiohttp.ClientResponseError as e:
-                    logging.error(f"Response error for {url}: {str(e)}")
-                    return None
-                except aiohttp.ClientConnectorError as e:
-                    logging.error(f"Connection error for {url}: {str(e)}")
-                    return None
-                except aiohttp.ClientPayloadError as e:
-                    logging.error(f"Payload error for {url}: {str(e)}")
-                    return None
-                except aiohttp.ClientConnectionError as e:
-                    logging.error(f"Connection error for {url}: {str(e)}")
-                    return None
-                except aiohttp.ServerTimeoutError as e:
-                    logging.error(f"Timeout error for {url}: {str(e)}")
-                    return None
+                    return (content, content_type)
+            except aiohttp.ClientResponseError as e:
+                logger.error("Response error for %s: %s", url, e)
+                return None
+            except aiohttp.ClientConnectorError as e:
+                logger.error("Connection error for %s: %s", url, e)
+                return None
+            except aiohttp.ClientPayloadError as e:
+                logger.error("Payload error for %s: %s", url, e)
+                return None
+            except aiohttp.ClientConnectionError as e:
+                logger.error("Connection error for %s: %s", url, e)
+                return None
+            except aiohttp.ServerTimeoutError as e:
+                logger.error("Timeout error for %s: %s", url, e)
+                return None
         
         except Exception as e:
             # Handle any other unexpected errors
-            logging.error(f"Error fetching URL {url}: {str(e)}")
-            return None 
\ No newline at end of file
+            logger.error("Error fetching URL %s: %s", url, e)
+            return None
@@ -1,9 +1,8 @@
 from mcp.server.fastmcp import FastMCP
 from app.core.config import settings
 from enum import Enum
-from app.utils.web_fetcher import WebFetcher
-from app.utils.html_parser import HTMLCleaner
-from app.utils.search_client import SearchClientFactory
+from app.utils.reader import read_page
+from app.utils.search_client import cached_search
 
 mcp = FastMCP("Surf")
 
@@ -13,6 +12,10 @@ class OutputFormat(str, Enum):
     markdown = "md"
 
 
+# FastMCP validates `format` into an OutputFormat member, so an identity check suffices
+_MD = OutputFormat.markdown
+
+
 @mcp.tool()
 async def read_url(
     url: str,
@@ -29,16 +32,14 @@ async def read_url(
     Returns:
         Processed content in requested format
     """
-    if not url.startswith(("http://", "https://")):
-        url = f"https://{url}"
-    fetch_result = await WebFetcher.fetch_url(url)
-
-    content, content_type = fetch_result
-
-    processed_content = await HTMLCleaner.process_html(content, content_type, url)
+    if url[:8] != "https://" and url[:7] != "http://":
+        url = "https://" + url
+    processed_content = await read_page(url, pretty_json=format is _MD)
+    if not processed_content:
+        raise ValueError(f"Failed to fetch URL: {url}")
 
     # Return in requested format
-    if format == OutputFormat.markdown:
+    if format is _MD:
         return processed_content["content"]
     else:
         # JSON format (default)
@@ -50,15 +51,15 @@ def format_results_as_markdown(results: list) -> str:
     if not results:
         return "No results found."
 
-    markdown = "# Search Results\n\n"
+    parts = ["# Search Results\n\n"]
 
     for i, result in enumerate(results, 1):
-        markdown += f"## {i}. {result.get('title', 'No Title')}\n\n"
-        markdown += f"**URL**: {result.get('url', 'No URL')}\n\n"
-        markdown += f"{result.get('snippet', 'No description available.')}\n\n"
-        markdown += "---\n\n"
+        parts.append(f"## {i}. {result.get('title', 'No Title')}\n\n")
+        parts.append(f"**URL**: {result.get('url', 'No URL')}\n\n")
+        parts.append(f"{result.get('snippet', 'No description available.')}\n\n")
+        parts.append("---\n\n")
 
-    return markdown
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -87,21 +88,19 @@ async def search(
         This endpoint uses the configured search provider (SearXNG, DuckDuckGo, or Brave Search).
         The current provider is: {settings.search.provider}
     """
-    search_client = SearchClientFactory.get_client()
-
     # Perform search
-    results = await search_client.search(
+    results = await cached_search(
         q, num_results=max_results, language=language, time_range=time_range
     )
 
     if not results:
-        if format == OutputFormat.markdown:
+        if format is _MD:
             return "No search results found."
         else:
             return {"results": [], "query": q}
 
     # Return in requested format
-    if format == OutputFormat.markdown:
+    if format is _MD:
         return format_results_as_markdown(results)
     else:
         # JSON format (default)
@@ -2,18 +2,26 @@
 
 import logging
 import sys
+from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Query, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from enum import Enum
 
 from app.core.config import settings
 from app.core.security import get_api_key
-from app.utils.web_fetcher import WebFetcher
-from app.utils.html_parser import HTMLCleaner
-from app.utils.search_client import SearchClientFactory
+from app.utils.reader import read_page, close_parse_pool
+from app.utils.search_client import cached_search
+from app.utils.orjson_response import ORJSONResponse
+from app.utils.http import close_session
+
+# uvloop is not available on Windows
+try:
+    import uvloop  # noqa: F401
+    _UVLOOP_AVAILABLE = True
+except ImportError:
+    _UVLOOP_AVAILABLE = False
 
 
 log_level = logging.DEBUG if settings.debug else logging.INFO
@@ -29,6 +37,14 @@ logger = logging.getLogger("surf")
 
 require_api_key = Depends(get_api_key)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_session()
+    close_parse_pool()
+
+
 app = FastAPI(
     title=settings.app_name,
     version="1.0.0",
@@ -36,6 +52,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -52,10 +70,14 @@ class OutputFormat(str, Enum):
     markdown = "md"
 
 
+# FastAPI validates `format` into an OutputFormat member, so an identity check suffices
+_MD = OutputFormat.markdown
+
+
 @app.exception_handler(Exception)
 async def _global_exc(request: Request, exc: Exception):
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(status_code=500, content={"detail": str(exc)})
+    return ORJSONResponse(status_code=500, content={"detail": str(exc)})
 
 
 @app.get("/", tags=["Root"])
@@ -80,17 +102,14 @@ async def read_url(
 ):
     """Fetch, clean, and return the content of a URL."""
     try:
-        if not url.startswith(("http://", "https://")):
-            url = f"https://{url}"
+        if url[:8] != "https://" and url[:7] != "http://":
+            url = "https://" + url
 
-        result = await WebFetcher.fetch_url(url)
-        if not result:
+        processed = await read_page(url, pretty_json=format is _MD)
+        if not processed:
             raise HTTPException(status_code=502, detail=f"Failed to fetch URL: {url}")
 
-        content, content_type = result
-        processed = await HTMLCleaner.process_html(content, content_type, url)
-
-        if format == OutputFormat.markdown:
+        if format is _MD:
             return processed["content"]
         return processed
     except HTTPException:
@@ -111,17 +130,16 @@ async def search(
 ):
     """Search the web using the configured search provider."""
     try:
-        client = SearchClientFactory.get_client()
-        results = await client.search(
+        results = await cached_search(
             q, num_results=max_results, language=language, time_range=time_range
         )
 
         if not results:
-            if format == OutputFormat.markdown:
+            if format is _MD:
                 return "No search results found."
             return {"results": [], "query": q}
 
-        if format == OutputFormat.markdown:
+        if format is _MD:
             lines = ["# Search Results\n"]
             for i, r in enumerate(results, 1):
                 lines.append(f"## {i}. {r.get('title', 'No Title')}\n")
@@ -143,4 +161,4 @@ async def search(
 if __name__ == "__main__":
     port = settings.port
     logger.info(f"Starting SURF API on port {port}")
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    uvicorn.run(app, host="0.0.0.0", port=port, loop="uvloop" if _UVLOOP_AVAILABLE else "asyncio")
@@ -0,0 +1,72 @@
+import unittest
+from urllib.parse import urljoin
+
+from app.utils.html_parser import HTMLCleaner, _make_url_joiner
+
+
+class CleanNonHtmlJsonTest(unittest.TestCase):
+    """JSON documents must survive parsing and re-indentation unchanged."""
+
+    def _content(self, document: str) -> str:
+        result = HTMLCleaner.clean_nonhtml(document, "application/json", "https://example.com/doc.json")
+        self.assertNotEqual(result["title"], "Invalid JSON Document")
+        self.assertTrue(result["content"].startswith("```json\n"))
+        return result["content"]
+
+    def test_large_integer_is_kept_exact(self):
+        content = self._content('{"id": 123456789012345678901234567890}')
+        self.assertIn("123456789012345678901234567890", content)
+        self.assertNotIn("e+29", content)
+
+    def test_nan_and_infinity_are_accepted(self):
+        content = self._content('{"low": NaN, "high": Infinity}')
+        self.assertIn("NaN", content)
+        self.assertIn("Infinity", content)
+
+    def test_invalid_json_is_reported(self):
+        result = HTMLCleaner.clean_nonhtml("{oops", "application/json", "https://example.com/doc.json")
+        self.assertEqual(result["title"], "Invalid JSON Document")
+
+
+class ProcessHtmlSniffTest(unittest.TestCase):
+    """text/html responses are only treated as plain text when they contain no markup."""
+
+    def _process(self, document: str) -> dict:
+        return HTMLCleaner.process_html(document, "text/html", "https://example.com/")
+
+    def test_leading_whitespace_before_doctype(self):
+        result = self._process("\n" * 1100 + "<!DOCTYPE html><html><head><title>Real</title></head><body><p>hi</p></body></html>")
+        self.assertEqual(result["title"], "Real")
+        self.assertEqual(result["content"], "hi")
+
+    def test_leading_text_before_markup(self):
+        result = self._process("banner " * 300 + "<html><head><title>Real</title></head><body><p>hi</p></body></html>")
+        self.assertEqual(result["title"], "Real")
+        self.assertNotIn("<html>", result["content"])
+
+    def test_plain_text_skips_parsing(self):
+        result = self._process("Just text\nmore")
+        self.assertEqual(result["title"], "Just text")
+        self.assertEqual(result["content"], "Just text\nmore")
+
+
+class UrlJoinerTest(unittest.TestCase):
+    """The fast joiner must resolve every href exactly as urljoin does."""
+
+    BASE = "https://example.com/docs/page?q=1#top"
+
+    def test_matches_urljoin(self):
+        join = _make_url_joiner(self.BASE)
+        hrefs = [
+            "https://other.org/a", "http://x/a/../b", "https://x/./a", "//cdn.example.com/a.png",
+            "//cdn.example.com/a/../b.png", "/abs", "/abs/./x", "/a/..", "rel", "../up", "#frag",
+            "?q=2", "https://x.org/a?", "/a#", "/a?#f", "/a;p", "https:///nohost", "//", " /lead",
+            "mailto:a@example.com", "",
+        ]
+        for href in hrefs:
+            with self.subTest(href=href):
+                self.assertEqual(join(href), urljoin(self.BASE, href))
+
+
+if __name__ == "__main__":
+    unittest.main()